@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 import io
+import json
 import logging
-from contextlib import redirect_stderr, redirect_stdout
-from datetime import datetime
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pandas as pd
+import pyarrow.parquet as pq
 import streamlit as st
 import yaml
 
+from src.data.loader import report_source
 from src.main import backtest as run_backtest
 from src.main import fundamentals_report as run_fundamentals_report
 from src.main import news_report as run_news_report
@@ -31,6 +36,10 @@ POLICY_SUMMARY = PROCESSED_DIR / "policy_beneficiary_stocks.csv"
 POLICY_EVIDENCE = PROCESSED_DIR / "policy_beneficiary_evidence.csv"
 FUND_RANKED = PROCESSED_DIR / "fundamentals_ranked_report.csv"
 FUND_TOP = PROCESSED_DIR / "fundamentals_top_picks.csv"
+FUND_SUMMARY = PROCESSED_DIR / "fundamentals_summary.json"
+
+DETAIL_ROWS = 30
+CATEGORICAL_COLUMNS = ("symbol", "vibe", "benefit_bucket", "return_potential_flag")
 
 
 COMPANY_SUMMARY_REQUIRED = {"news_count", "vibe", "avg_sentiment"}
@@ -55,16 +64,28 @@ POLICY_EVIDENCE_REQUIRED = {
     "matched_categories",
     "policy_row_score",
 }
+JOB_OUTPUTS = {
+    "train": ("last_train_output", "Training completed.", "Training failed."),
+    "backtest": ("last_backtest_output", "Backtest completed.", "Backtest failed."),
+    "news_report": ("last_news_output", "News reports refreshed.", "News report refresh failed."),
+    "policy_report": (
+        "last_policy_output",
+        "Policy beneficiary report refreshed.",
+        "Policy beneficiary report refresh failed.",
+    ),
+    "fundamentals_report": ("last_fund_output", "Fundamentals report refreshed.", "Fundamentals report refresh failed."),
+}
 
 
 def _log(message: str) -> None:
-    line = f"{datetime.now().strftime('%H:%M:%S')} | {message}"
+    line = f"{time.strftime('%H:%M:%S')} | {message}"
     LOGGER.info(message)
-    logs = st.session_state.get("app_logs", [])
-    logs.append(line)
-    st.session_state["app_logs"] = logs[-500:]
+    if "app_logs" not in st.session_state:
+        st.session_state["app_logs"] = deque(maxlen=500)
+    st.session_state["app_logs"].append(line)
 
 
+@st.cache_resource(show_spinner=False)
 def _load_config() -> dict:
     _log(f"Loading config from {CONFIG_PATH}")
     with open(CONFIG_PATH, "r", encoding="utf-8") as f:
@@ -72,21 +93,118 @@ def _load_config() -> dict:
 
 
 def _run_main_function(fn, cfg: dict) -> tuple[bool, str]:
+    # Runs on a worker thread: log through LOGGER only, st.session_state is not available here.
     name = getattr(fn, "__name__", "unknown_fn")
-    _log(f"Running function: {name}")
     buffer = io.StringIO()
+    # Per-run handler filtered to this thread, so concurrent jobs never interleave output.
+    handler = logging.StreamHandler(buffer)
+    handler.setLevel(logging.INFO)
+    thread_id = threading.get_ident()
+    handler.addFilter(lambda record: record.thread == thread_id)
+    root = logging.getLogger()
+    root.addHandler(handler)
+    error: Exception | None = None
     try:
-        with redirect_stdout(buffer), redirect_stderr(buffer):
-            fn(cfg)
-        _log(f"Function succeeded: {name}")
-        return True, buffer.getvalue().strip()
+        fn(cfg)
     except Exception as e:
-        _log(f"Function failed: {name} ({e})")
-        logs = buffer.getvalue().strip()
-        if logs:
-            logs += "\n"
-        logs += f"ERROR: {e}"
-        return False, logs
+        error = e
+    finally:
+        root.removeHandler(handler)
+
+    # Status lines are logged after the handler is removed so they stay out of the command output.
+    logs = buffer.getvalue().strip()
+    if error is None:
+        LOGGER.info(f"Function succeeded: {name}")
+        return True, logs
+    LOGGER.info(f"Function failed: {name} ({error})")
+    if logs:
+        logs += "\n"
+    logs += f"ERROR: {error}"
+    return False, logs
+
+
+def _start_job(name: str, fn) -> None:
+    jobs = st.session_state.setdefault("jobs", {})
+    if name in jobs:
+        st.info(f"{name} is already running.")
+        return
+    if "bg_exec" not in st.session_state:
+        st.session_state["bg_exec"] = ThreadPoolExecutor(max_workers=2)
+    _log(f"Running function: {name}")
+    jobs[name] = st.session_state["bg_exec"].submit(_run_main_function, fn, _load_config())
+
+
+def _collect_finished_jobs() -> bool:
+    jobs = st.session_state.get("jobs", {})
+    finished = [name for name, future in jobs.items() if future.done()]
+    for name in finished:
+        ok, out = jobs.pop(name).result()
+        output_key, ok_msg, fail_msg = JOB_OUTPUTS[name]
+        st.session_state[output_key] = out[-8000:]
+        if ok:
+            _read_table.clear()
+            _read_details.clear()
+            _read_detail_index.clear()
+            _read_symbol_rows.clear()
+            _read_json.clear()
+        _log(f"Function {'succeeded' if ok else 'failed'}: {name}")
+        st.session_state.setdefault("job_notices", []).append((ok, ok_msg if ok else fail_msg))
+    return bool(finished)
+
+
+@st.fragment(run_every=2)
+def _job_monitor() -> None:
+    if _collect_finished_jobs():
+        # Full rerun so the active screen reloads the regenerated reports.
+        st.rerun()
+    for name in st.session_state.get("jobs", {}):
+        st.info(f"Running {name}...")
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _read_table(path_str: str, mtime: float) -> pd.DataFrame:
+    # mtime is part of the cache key so a rewritten report is picked up immediately.
+    if path_str.endswith(".parquet"):
+        df = pd.read_parquet(path_str)
+    else:
+        df = pd.read_csv(path_str, engine="pyarrow")
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _read_details(path_str: str, mtime: float) -> pd.DataFrame:
+    # CSV fallback: keep at most DETAIL_ROWS headlines per symbol and index them once so a
+    # symbol switch is a .loc lookup instead of a full-column equality scan.
+    df = _read_table(path_str, mtime)
+    head = df.groupby("symbol", sort=False, observed=True).head(DETAIL_ROWS)
+    return head.set_index("symbol", drop=False).sort_index(kind="stable")
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _read_detail_index(path_str: str, mtime: float) -> tuple[list[str], list[str], int]:
+    if path_str.endswith(".parquet"):
+        # Schema, row count and the symbol column only; headline rows are read per symbol.
+        columns = pq.read_schema(path_str).names
+        rows = pq.read_metadata(path_str).num_rows
+        symbols = pd.read_parquet(path_str, columns=["symbol"])["symbol"] if "symbol" in columns else None
+    else:
+        df = _read_table(path_str, mtime)
+        columns, rows = list(df.columns), len(df)
+        symbols = df["symbol"] if "symbol" in columns else None
+    if symbols is None:
+        return columns, [], rows
+    return columns, symbols.astype("category").cat.categories.tolist(), rows
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _read_symbol_rows(path_str: str, mtime: float, symbol: str) -> pd.DataFrame:
+    if path_str.endswith(".parquet"):
+        # Detail Parquet files are clustered by symbol, so row-group statistics prune the read.
+        return pd.read_parquet(path_str, filters=[("symbol", "==", symbol)]).head(DETAIL_ROWS)
+    return _read_details(path_str, mtime).loc[[symbol]]
 
 
 def _load_csv(path: Path) -> pd.DataFrame:
@@ -94,20 +212,66 @@ def _load_csv(path: Path) -> pd.DataFrame:
         _log(f"CSV not found: {path}")
         return pd.DataFrame()
     try:
-        df = pd.read_csv(path)
-        _log(f"Loaded CSV: {path.name} rows={len(df)}")
+        src = report_source(path)
+        df = _read_table(str(src), src.stat().st_mtime)
+        _log(f"Loaded CSV: {src.name} rows={len(df)}")
         return df
     except Exception as e:
         _log(f"Failed to read CSV: {path.name} ({e})")
         return pd.DataFrame()
 
 
-def _missing_columns(df: pd.DataFrame, required: set[str]) -> list[str]:
-    return sorted(col for col in required if col not in df.columns)
+def _load_details(path: Path) -> tuple[Path | None, list[str], list[str]]:
+    # Returns (source, columns, symbols); source is None when there is nothing to show.
+    if not path.exists():
+        _log(f"CSV not found: {path}")
+        return None, [], []
+    try:
+        src = report_source(path)
+        columns, symbols, rows = _read_detail_index(str(src), src.stat().st_mtime)
+        _log(f"Indexed details: {src.name} rows={rows} symbols={len(symbols)}")
+        return (src if rows else None), columns, symbols
+    except Exception as e:
+        _log(f"Failed to read CSV: {path.name} ({e})")
+        return None, [], []
+
+
+def _symbol_rows(src: Path, symbol: str) -> pd.DataFrame:
+    return _read_symbol_rows(str(src), src.stat().st_mtime, symbol)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _read_json(path_str: str, mtime: float) -> dict:
+    with open(path_str, "r", encoding="utf-8") as f:
+        return json.load(f)
 
 
-def _warn_if_missing(df: pd.DataFrame, required: set[str], label: str) -> bool:
-    missing = _missing_columns(df, required)
+def _load_fund_summary() -> dict:
+    # Only trust the KPI file when it was written alongside (or after) the ranked report.
+    if not FUND_SUMMARY.exists():
+        return {}
+    if FUND_RANKED.exists() and FUND_SUMMARY.stat().st_mtime < FUND_RANKED.stat().st_mtime:
+        return {}
+    try:
+        return _read_json(str(FUND_SUMMARY), FUND_SUMMARY.stat().st_mtime)
+    except Exception as e:
+        _log(f"Failed to read JSON: {FUND_SUMMARY.name} ({e})")
+        return {}
+
+
+def _filter_options(df: pd.DataFrame, col: str) -> list:
+    # Categorical columns already carry their sorted distinct values; no need to rescan the rows.
+    if isinstance(df[col].dtype, pd.CategoricalDtype):
+        return df[col].cat.categories.tolist()
+    return sorted(df[col].dropna().unique().tolist())
+
+
+def _missing_columns(columns, required: set[str]) -> list[str]:
+    return sorted(col for col in required if col not in columns)
+
+
+def _warn_if_missing(columns, required: set[str], label: str) -> bool:
+    missing = _missing_columns(columns, required)
     if not missing:
         return False
     msg = f"{label} is missing columns: {', '.join(missing)}"
@@ -118,52 +282,27 @@ def _warn_if_missing(df: pd.DataFrame, required: set[str], label: str) -> bool:
 
 def _refresh_news_reports() -> None:
     _log("Trigger: refresh news reports")
-    ok, out = _run_main_function(run_news_report, _load_config())
-    st.session_state["last_news_output"] = out[-8000:]
-    if ok:
-        st.success("News reports refreshed.")
-    else:
-        st.error("News report refresh failed.")
+    _start_job("news_report", run_news_report)
 
 
 def _refresh_policy_report() -> None:
     _log("Trigger: refresh policy beneficiary report")
-    ok, out = _run_main_function(run_policy_report, _load_config())
-    st.session_state["last_policy_output"] = out[-8000:]
-    if ok:
-        st.success("Policy beneficiary report refreshed.")
-    else:
-        st.error("Policy beneficiary report refresh failed.")
+    _start_job("policy_report", run_policy_report)
 
 
 def _refresh_fundamentals_report() -> None:
     _log("Trigger: refresh fundamentals report")
-    ok, out = _run_main_function(run_fundamentals_report, _load_config())
-    st.session_state["last_fund_output"] = out[-8000:]
-    if ok:
-        st.success("Fundamentals report refreshed.")
-    else:
-        st.error("Fundamentals report refresh failed.")
+    _start_job("fundamentals_report", run_fundamentals_report)
 
 
 def _run_training() -> None:
     _log("Trigger: run train")
-    ok, out = _run_main_function(run_train, _load_config())
-    st.session_state["last_train_output"] = out[-8000:]
-    if ok:
-        st.success("Training completed.")
-    else:
-        st.error("Training failed.")
+    _start_job("train", run_train)
 
 
 def _run_backtest_job() -> None:
     _log("Trigger: run backtest")
-    ok, out = _run_main_function(run_backtest, _load_config())
-    st.session_state["last_backtest_output"] = out[-8000:]
-    if ok:
-        st.success("Backtest completed.")
-    else:
-        st.error("Backtest failed.")
+    _start_job("backtest", run_backtest)
 
 
 def _kpi(label: str, value: str) -> None:
@@ -176,7 +315,8 @@ def _screen_overview() -> None:
     c = _load_csv(COMPANY_SUMMARY)
     ceo = _load_csv(CEO_SUMMARY)
     p = _load_csv(POLICY_SUMMARY)
-    f = _load_csv(FUND_RANKED)
+    fund_summary = _load_fund_summary()
+    fund_rows = fund_summary["total"] if fund_summary else len(_load_csv(FUND_RANKED))
 
     col1, col2, col3, col4 = st.columns(4)
     with col1:
@@ -186,7 +326,7 @@ def _screen_overview() -> None:
     with col3:
         _kpi("Policy Beneficiary Rows", f"{len(p):,}")
     with col4:
-        _kpi("Fundamentals Rows", f"{len(f):,}")
+        _kpi("Fundamentals Rows", f"{fund_rows:,}")
 
     st.caption("Use the left navigation to open each screen.")
 
@@ -198,58 +338,55 @@ def _screen_modeling() -> None:
 
     with c1:
         if st.button("Run Train", use_container_width=True):
-            with st.spinner("Running train..."):
-                _run_training()
+            _run_training()
 
     with c2:
         if st.button("Run Backtest", use_container_width=True):
-            with st.spinner("Running backtest..."):
-                _run_backtest_job()
+            _run_backtest_job()
 
 
 def _screen_company_news() -> None:
     _log("Screen: Company News")
     st.subheader("Company News Sentiment (30D)")
     if st.button("Create/Refresh Company + CEO News Reports", use_container_width=True):
-        with st.spinner("Running news_report..."):
-            _refresh_news_reports()
+        _refresh_news_reports()
 
     c = _load_csv(COMPANY_SUMMARY)
-    d = _load_csv(COMPANY_DETAILS)
+    d_src, d_columns, symbols = _load_details(COMPANY_DETAILS)
 
     if c.empty:
         st.warning("Company summary report not found. Click refresh.")
         return
 
-    if _warn_if_missing(c, COMPANY_SUMMARY_REQUIRED, "Company summary CSV"):
+    if _warn_if_missing(c.columns, COMPANY_SUMMARY_REQUIRED, "Company summary CSV"):
         return
 
     min_news = st.slider("Min News Count", 1, int(c["news_count"].max()), 3)
-    vibes_all = sorted(c["vibe"].dropna().unique().tolist())
+    vibes_all = _filter_options(c, "vibe")
     vibes = st.multiselect("Vibe", vibes_all, default=vibes_all)
 
-    view = c[(c["news_count"] >= min_news) & (c["vibe"].isin(vibes))].copy()
+    view = c.loc[(c["news_count"] >= min_news) & (c["vibe"].isin(vibes))]
     st.dataframe(view, use_container_width=True)
 
     st.markdown("Top 20 Positive by Avg Sentiment")
-    st.dataframe(view.sort_values("avg_sentiment", ascending=False).head(20), use_container_width=True)
+    st.dataframe(view.nlargest(20, "avg_sentiment"), use_container_width=True)
 
-    if d.empty:
+    if d_src is None:
         return
-    if _warn_if_missing(d, COMPANY_DETAILS_REQUIRED, "Company details CSV"):
+    if _warn_if_missing(d_columns, COMPANY_DETAILS_REQUIRED, "Company details CSV"):
         return
 
     st.markdown("Recent Headlines")
-    symbols = sorted(d["symbol"].dropna().astype(str).unique().tolist())
     if not symbols:
         st.info("Company details CSV has no symbol rows to display.")
         return
 
     selected = st.selectbox("Symbol", symbols, index=0)
-    dv = d[d["symbol"].astype(str) == selected].head(30).copy()
+    dv = _symbol_rows(d_src, selected)
     st.dataframe(
         dv[["symbol", "published", "title", "link", "source", "sentiment_label", "sentiment_score"]],
         use_container_width=True,
+        hide_index=True,
         column_config={"link": st.column_config.LinkColumn("News Link")},
     )
 
@@ -258,37 +395,37 @@ def _screen_ceo_commentary() -> None:
     _log("Screen: CEO Commentary")
     st.subheader("CEO Commentary Sentiment (30D)")
     ceo = _load_csv(CEO_SUMMARY)
-    d = _load_csv(CEO_DETAILS)
+    d_src, d_columns, symbols = _load_details(CEO_DETAILS)
 
     if ceo.empty:
         st.warning("CEO summary report not found. Click refresh in Company News screen.")
         return
 
-    if _warn_if_missing(ceo, CEO_SUMMARY_REQUIRED, "CEO summary CSV"):
+    if _warn_if_missing(ceo.columns, CEO_SUMMARY_REQUIRED, "CEO summary CSV"):
         return
 
     min_news = st.slider("Min CEO Mentions", 1, int(max(1, ceo["news_count"].max())), 2)
-    view = ceo[ceo["news_count"] >= min_news].copy()
+    view = ceo.loc[ceo["news_count"] >= min_news]
     st.dataframe(view, use_container_width=True)
 
     st.markdown("Top 20 CEO Sentiment")
-    st.dataframe(view.sort_values("avg_sentiment", ascending=False).head(20), use_container_width=True)
+    st.dataframe(view.nlargest(20, "avg_sentiment"), use_container_width=True)
 
-    if d.empty:
+    if d_src is None:
         return
-    if _warn_if_missing(d, COMPANY_DETAILS_REQUIRED, "CEO details CSV"):
+    if _warn_if_missing(d_columns, COMPANY_DETAILS_REQUIRED, "CEO details CSV"):
         return
 
-    symbols = sorted(d["symbol"].dropna().astype(str).unique().tolist())
     if not symbols:
         st.info("CEO details CSV has no symbol rows to display.")
         return
 
     selected = st.selectbox("Symbol (CEO)", symbols, index=0)
-    dv = d[d["symbol"].astype(str) == selected].head(30).copy()
+    dv = _symbol_rows(d_src, selected)
     st.dataframe(
         dv[["symbol", "published", "title", "link", "source", "sentiment_label", "sentiment_score"]],
         use_container_width=True,
+        hide_index=True,
         column_config={"link": st.column_config.LinkColumn("News Link")},
     )
 
@@ -299,44 +436,43 @@ def _screen_policy_beneficiaries() -> None:
     st.caption("Built from company Google-news headlines using policy/scheme keyword + sentiment scoring.")
 
     if st.button("Create/Refresh Policy Beneficiary Report", use_container_width=True):
-        with st.spinner("Running policy_report..."):
-            _refresh_policy_report()
+        _refresh_policy_report()
 
     p = _load_csv(POLICY_SUMMARY)
-    e = _load_csv(POLICY_EVIDENCE)
+    e_src, e_columns, symbols = _load_details(POLICY_EVIDENCE)
 
     if p.empty:
         st.warning("Policy beneficiary report not found. Generate company news first, then refresh this page.")
         return
 
-    if _warn_if_missing(p, POLICY_SUMMARY_REQUIRED, "Policy summary CSV"):
+    if _warn_if_missing(p.columns, POLICY_SUMMARY_REQUIRED, "Policy summary CSV"):
         return
 
     min_mentions = st.slider("Min Scheme Mentions", 1, int(max(1, p["scheme_mentions"].max())), 2)
-    buckets = sorted(p["benefit_bucket"].dropna().unique().tolist())
+    buckets = _filter_options(p, "benefit_bucket")
     selected_buckets = st.multiselect("Benefit Category", buckets, default=buckets)
 
-    view = p[(p["scheme_mentions"] >= min_mentions) & (p["benefit_bucket"].isin(selected_buckets))].copy()
+    view = p.loc[(p["scheme_mentions"] >= min_mentions) & (p["benefit_bucket"].isin(selected_buckets))]
     st.dataframe(view, use_container_width=True)
 
     st.markdown("Top 25 by Policy Benefit Score")
-    st.dataframe(view.sort_values("policy_benefit_score", ascending=False).head(25), use_container_width=True)
+    st.dataframe(view.nlargest(25, "policy_benefit_score"), use_container_width=True)
 
-    if e.empty:
+    if e_src is None:
         return
-    if _warn_if_missing(e, POLICY_EVIDENCE_REQUIRED, "Policy evidence CSV"):
+    if _warn_if_missing(e_columns, POLICY_EVIDENCE_REQUIRED, "Policy evidence CSV"):
         return
 
-    symbols = sorted(e["symbol"].dropna().astype(str).unique().tolist())
     if not symbols:
         st.info("Policy evidence CSV has no symbol rows to display.")
         return
 
     selected = st.selectbox("Symbol (Policy Evidence)", symbols, index=0)
-    ev = e[e["symbol"].astype(str) == selected].head(30).copy()
+    ev = _symbol_rows(e_src, selected)
     st.dataframe(
         ev[["symbol", "published", "title", "link", "source", "sentiment_score", "matched_categories", "policy_row_score"]],
         use_container_width=True,
+        hide_index=True,
         column_config={"link": st.column_config.LinkColumn("News Link")},
     )
 
@@ -345,8 +481,7 @@ def _screen_fundamentals() -> None:
     _log("Screen: Fundamentals")
     st.subheader("Fundamentals + Sentiment Ranking")
     if st.button("Create/Refresh Fundamentals Report", use_container_width=True):
-        with st.spinner("Running fundamentals_report..."):
-            _refresh_fundamentals_report()
+        _refresh_fundamentals_report()
 
     rank = _load_csv(FUND_RANKED)
     top = _load_csv(FUND_TOP)
@@ -355,19 +490,26 @@ def _screen_fundamentals() -> None:
         st.warning("Fundamentals report not found. Click refresh.")
         return
 
+    summary = _load_fund_summary()
+    if summary:
+        high, watchlist, avoid = summary["high"], summary["watchlist"], summary["avoid"]
+    else:
+        high = (rank["return_potential_flag"] == "High Potential").sum()
+        watchlist = (rank["return_potential_flag"] == "Watchlist").sum()
+        avoid = (rank["return_potential_flag"] == "Avoid/Needs Work").sum()
+
     c1, c2, c3 = st.columns(3)
     with c1:
-        _kpi("High Potential", f"{(rank['return_potential_flag'] == 'High Potential').sum():,}")
+        _kpi("High Potential", f"{high:,}")
     with c2:
-        _kpi("Watchlist", f"{(rank['return_potential_flag'] == 'Watchlist').sum():,}")
+        _kpi("Watchlist", f"{watchlist:,}")
     with c3:
-        _kpi("Avoid/Needs Work", f"{(rank['return_potential_flag'] == 'Avoid/Needs Work').sum():,}")
+        _kpi("Avoid/Needs Work", f"{avoid:,}")
 
-    flags = sorted(rank["return_potential_flag"].dropna().unique().tolist())
+    flags = _filter_options(rank, "return_potential_flag")
     selected_flags = st.multiselect("Category", flags, default=flags)
     min_score = st.slider("Minimum Score", int(rank["score"].min()), int(rank["score"].max()), 5)
 
-    view = rank[(rank["return_potential_flag"].isin(selected_flags)) & (rank["score"] >= min_score)].copy()
     cols = [
         "symbol",
         "company_name",
@@ -381,8 +523,11 @@ def _screen_fundamentals() -> None:
         "ceo_commentary_sentiment",
         "reason_summary",
     ]
-    show_cols = [c for c in cols if c in view.columns]
-    st.dataframe(view[show_cols], use_container_width=True)
+    show_cols = [c for c in cols if c in rank.columns]
+    # Filter and project in one .loc take so hidden columns are never copied.
+    mask = rank["return_potential_flag"].isin(selected_flags) & (rank["score"] >= min_score)
+    view = rank.loc[mask, show_cols]
+    st.dataframe(view, use_container_width=True)
 
     if not top.empty:
         st.markdown("Top Picks File (as generated)")
@@ -393,6 +538,13 @@ def main() -> None:
     st.set_page_config(page_title="NSE Stock Analysis", layout="wide")
     st.title("NSE Stock Analysis UI")
 
+    _collect_finished_jobs()
+    for ok, msg in st.session_state.pop("job_notices", []):
+        if ok:
+            st.success(msg)
+        else:
+            st.error(msg)
+
     screens = {
         "Overview": _screen_overview,
         "Modeling": _screen_modeling,
@@ -406,6 +558,10 @@ def main() -> None:
     _log(f"Navigation selected: {choice}")
     screens[choice]()
 
+    if st.session_state.get("jobs"):
+        with st.sidebar:
+            _job_monitor()
+
     with st.expander("Command Logs"):
         st.text_area("train output", st.session_state.get("last_train_output", ""), height=140)
         st.text_area("backtest output", st.session_state.get("last_backtest_output", ""), height=140)
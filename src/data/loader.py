@@ -1,6 +1,54 @@
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 
 def load_prices(path: str) -> pd.DataFrame:
-    df = pd.read_csv(path)
-    df["date"] = pd.to_datetime(df["date"])
+    df = pd.read_csv(path, engine="pyarrow", parse_dates=["date"])
     return df.sort_values(["symbol", "date"]).reset_index(drop=True)
+
+def report_source(csv_path: str | Path) -> Path:
+    # Prefer the Parquet sibling unless the CSV is newer (e.g. updated by a checkout or a hand edit).
+    csv = Path(csv_path)
+    parquet = csv.with_suffix(".parquet")
+    if parquet.exists() and (not csv.exists() or parquet.stat().st_mtime >= csv.stat().st_mtime):
+        return parquet
+    return csv
+
+def temp_path(target: Path) -> Path:
+    # Unique per process and thread, so concurrent writers of one target never share a temp file.
+    return target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+def _fast_to_csv(table: pa.Table, csv_path: str) -> None:
+    pacsv.write_csv(table, csv_path, write_options=pacsv.WriteOptions(quoting_style="needed"))
+
+def write_report(df: pd.DataFrame, csv_path: str, sort_by: str | None = None) -> None:
+    # Filtered or head()-ed frames keep every category; readers list categories as filter options.
+    categorical = df.select_dtypes("category").columns
+    if len(categorical):
+        df = df.assign(**{c: df[c].cat.remove_unused_categories() for c in categorical})
+    # Convert before writing anything: a frame Arrow cannot type fails here, not after a CSV without its Parquet.
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # CSV stays the canonical output; the Parquet sibling is a faster typed copy for readers.
+    # Both are written to temp files and renamed into place, so jobs reading them never see a partial file.
+    csv = Path(csv_path)
+    parquet_path = csv.with_suffix(".parquet")
+    csv_tmp = temp_path(csv)
+    parquet_tmp = temp_path(parquet_path)
+    try:
+        _fast_to_csv(table, str(csv_tmp))
+        if sort_by is None:
+            df.to_parquet(parquet_tmp, index=False)
+        else:
+            # Clustering by key keeps each key in few row groups, so filtered reads skip the rest via statistics.
+            df.sort_values(sort_by, kind="stable").to_parquet(parquet_tmp, index=False, row_group_size=2048)
+        csv_tmp.replace(csv)
+        parquet_tmp.replace(parquet_path)
+    finally:
+        csv_tmp.unlink(missing_ok=True)
+        parquet_tmp.unlink(missing_ok=True)
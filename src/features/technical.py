@@ -1,18 +1,30 @@
 import numpy as np
 import pandas as pd
 
+def _rolling_mean(grouped, window: int) -> pd.Series:
+    # Grouped rolling dispatches to the Cython window kernel instead of a per-group lambda.
+    return grouped.rolling(window).mean().reset_index(level=0, drop=True)
+
+def _wilder_mean(grouped, window: int) -> pd.Series:
+    # Wilder smoothing is an EMA with alpha=1/window: one O(N) recurrence, no window buffer.
+    ewm = grouped.ewm(alpha=1.0 / window, adjust=False, min_periods=window)
+    return ewm.mean().reset_index(level=0, drop=True)
+
 def add_technical_features(df: pd.DataFrame, rsi_window=14, ma_fast=10, ma_slow=30) -> pd.DataFrame:
-    out = df.copy()
-    out["ret_1d"] = out.groupby("symbol")["close"].pct_change()
-    out["ma_fast"] = out.groupby("symbol")["close"].transform(lambda s: s.rolling(ma_fast).mean())
-    out["ma_slow"] = out.groupby("symbol")["close"].transform(lambda s: s.rolling(ma_slow).mean())
+    # Sort once on a categorical symbol so every groupby below is a contiguous scan.
+    out = df.assign(symbol=df["symbol"].astype("category")).sort_values(["symbol", "date"], kind="stable")
+    g = out.groupby("symbol", sort=False, observed=True)["close"]
+
+    out["ret_1d"] = g.pct_change()
+    out["ma_fast"] = _rolling_mean(g, ma_fast)
+    out["ma_slow"] = _rolling_mean(g, ma_slow)
     out["mom_ma"] = out["ma_fast"] / out["ma_slow"] - 1.0
 
-    delta = out.groupby("symbol")["close"].diff()
+    delta = g.diff()
     gain = delta.clip(lower=0)
     loss = -delta.clip(upper=0)
-    avg_gain = gain.groupby(out["symbol"]).transform(lambda s: s.rolling(rsi_window).mean())
-    avg_loss = loss.groupby(out["symbol"]).transform(lambda s: s.rolling(rsi_window).mean())
+    avg_gain = _wilder_mean(gain.groupby(out["symbol"], sort=False, observed=True), rsi_window)
+    avg_loss = _wilder_mean(loss.groupby(out["symbol"], sort=False, observed=True), rsi_window)
 
     # Keep RSI finite for monotonic segments by adding epsilon to denominator.
     rs = avg_gain / (avg_loss + 1e-9)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # optional; report.py falls back to the NumPy scorer
+    njit = None
+    prange = range
+
+NUMBA_AVAILABLE = njit is not None
+
+# Below this many rows thread start-up costs more than the parallel loop saves.
+PARALLEL_MIN_ROWS = 1024
+
+PE_ASSESSMENTS = (
+    "unavailable_or_loss_making",
+    "undervalued_vs_industry",
+    "fair_vs_industry",
+    "overvalued_vs_industry",
+    "low_absolute_pe",
+    "mid_absolute_pe",
+    "high_absolute_pe",
+)
+
+# Same order as the rules in report._score_vectorized; column k of the reason mask maps to REASONS[k].
+REASONS = (
+    "PE favorable",
+    "PE acceptable",
+    "Forward PE improving",
+    "PEG attractive",
+    "PEG reasonable",
+    "High ROE",
+    "Decent ROE",
+    "Healthy margins",
+    "Manageable debt",
+    "High leverage",
+    "High insider/promoter proxy",
+    "Moderate insider/promoter proxy",
+    "Strong company news sentiment",
+    "Positive company news sentiment",
+    "Negative company news sentiment",
+    "Positive CEO sentiment",
+    "Negative CEO sentiment",
+)
+
+
+def _score_row(i, pe, fpe, peg, roe, margin, d2e, promoter, c_sent, ceo_sent, ind_med, out_score, out_pe_code, out_reason_mask):
+    score = 0
+    p = pe[i]
+    med = ind_med[i]
+    if np.isnan(p) or p <= 0:
+        code = 0
+    elif med > 0:
+        ratio = p / med
+        if ratio <= 0.9:
+            code = 1
+        elif ratio <= 1.2:
+            code = 2
+        else:
+            code = 3
+    elif p <= 15:
+        code = 4
+    elif p <= 25:
+        code = 5
+    else:
+        code = 6
+    out_pe_code[i] = code
+
+    if code == 1 or code == 4:
+        score += 2
+        out_reason_mask[i, 0] = True
+    elif code == 2 or code == 5:
+        score += 1
+        out_reason_mask[i, 1] = True
+
+    if fpe[i] > 0 and p > 0 and fpe[i] < p:
+        score += 1
+        out_reason_mask[i, 2] = True
+
+    if peg[i] > 0:
+        if peg[i] <= 1.2:
+            score += 2
+            out_reason_mask[i, 3] = True
+        elif peg[i] <= 1.8:
+            score += 1
+            out_reason_mask[i, 4] = True
+
+    if roe[i] >= 0.15:
+        score += 2
+        out_reason_mask[i, 5] = True
+    elif roe[i] >= 0.10:
+        score += 1
+        out_reason_mask[i, 6] = True
+
+    if margin[i] >= 0.10:
+        score += 1
+        out_reason_mask[i, 7] = True
+
+    if d2e[i] <= 80:
+        score += 1
+        out_reason_mask[i, 8] = True
+    elif d2e[i] >= 250:
+        score -= 1
+        out_reason_mask[i, 9] = True
+
+    if promoter[i] >= 45:
+        score += 2
+        out_reason_mask[i, 10] = True
+    elif promoter[i] >= 25:
+        score += 1
+        out_reason_mask[i, 11] = True
+
+    if c_sent[i] >= 0.20:
+        score += 2
+        out_reason_mask[i, 12] = True
+    elif c_sent[i] >= 0.08:
+        score += 1
+        out_reason_mask[i, 13] = True
+    elif c_sent[i] <= -0.08:
+        score -= 1
+        out_reason_mask[i, 14] = True
+
+    if ceo_sent[i] >= 0.15:
+        score += 1
+        out_reason_mask[i, 15] = True
+    elif ceo_sent[i] <= -0.08:
+        score -= 1
+        out_reason_mask[i, 16] = True
+
+    out_score[i] = score
+
+
+# Serial and parallel builds wrap distinct functions: numba keys its on-disk cache by function, not by jit flags.
+def _score_serial(pe, fpe, peg, roe, margin, d2e, promoter, c_sent, ceo_sent, ind_med, out_score, out_pe_code, out_reason_mask):
+    for i in range(pe.shape[0]):
+        _score_row(i, pe, fpe, peg, roe, margin, d2e, promoter, c_sent, ceo_sent, ind_med, out_score, out_pe_code, out_reason_mask)
+
+
+def _score_parallel(pe, fpe, peg, roe, margin, d2e, promoter, c_sent, ceo_sent, ind_med, out_score, out_pe_code, out_reason_mask):
+    # Rows are independent, so prange needs no locks.
+    for i in prange(pe.shape[0]):
+        _score_row(i, pe, fpe, peg, roe, margin, d2e, promoter, c_sent, ceo_sent, ind_med, out_score, out_pe_code, out_reason_mask)
+
+
+if NUMBA_AVAILABLE:
+    _score_row = njit(cache=True)(_score_row)
+    score_all = njit(cache=True)(_score_serial)
+    score_all_parallel = njit(parallel=True, cache=True, boundscheck=False)(_score_parallel)
+else:
+    score_all = score_all_parallel = None
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import json
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
-from time import sleep
-from typing import Any
+from dataclasses import dataclass, fields
+from pathlib import Path
+from time import sleep, time
+from typing import Any, get_args, get_type_hints
 
 import pandas as pd
 import yfinance as yf
+from curl_cffi import requests as curl_requests
+
+from src.data.loader import temp_path
+
+# One keep-alive session for every ticker lookup; yfinance only accepts curl_cffi sessions.
+_SESSION = curl_requests.Session(impersonate="chrome")
 
 
 @dataclass
@@ -28,6 +36,13 @@ class FundamentalRow:
     promoter_holding_proxy_pct: float | None
 
 
+FUNDAMENTAL_FIELDS = [f.name for f in fields(FundamentalRow)]
+# Resolved hints rather than annotation strings, so Optional[float] or float | None both count.
+NUMERIC_FIELDS = [
+    name for name, hint in get_type_hints(FundamentalRow).items() if hint is float or float in get_args(hint)
+]
+
+
 def _to_float(value: Any) -> float | None:
     if value is None:
         return None
@@ -44,14 +59,48 @@ def _yahoo_ticker(symbol: str) -> str:
     return f"{symbol}.NS"
 
 
-def fetch_single_fundamental(symbol: str, company_name: str, retries: int = 2) -> FundamentalRow:
+def _read_cached_info(cache_dir: str | None, ticker: str, ttl_hours: float) -> dict:
+    if not cache_dir or ttl_hours <= 0:
+        return {}
+    p = Path(cache_dir) / f"{ticker}.json"
+    try:
+        if time() - p.stat().st_mtime > ttl_hours * 3600:
+            return {}
+        with open(p, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def _write_cached_info(cache_dir: str | None, ticker: str, info: dict) -> None:
+    if not cache_dir or not info:
+        return
+    p = Path(cache_dir) / f"{ticker}.json"
+    tmp = temp_path(p)
+    try:
+        p.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(info, f, default=str)
+        tmp.replace(p)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+
+
+def fetch_single_fundamental(
+    symbol: str,
+    company_name: str,
+    retries: int = 2,
+    cache_dir: str | None = None,
+    cache_ttl_hours: float = 0,
+) -> FundamentalRow:
     ticker = _yahoo_ticker(symbol)
 
-    info = {}
+    info = _read_cached_info(cache_dir, ticker, cache_ttl_hours)
+    from_cache = bool(info)
     last_err: Exception | None = None
-    for attempt in range(retries + 1):
+    for attempt in range(0 if from_cache else retries + 1):
         try:
-            t = yf.Ticker(ticker)
+            t = yf.Ticker(ticker, session=_SESSION)
             info = t.info or {}
             if info:
                 break
@@ -61,6 +110,8 @@ def fetch_single_fundamental(symbol: str, company_name: str, retries: int = 2) -
 
     if not info and last_err is not None:
         raise last_err
+    if not from_cache and cache_ttl_hours > 0:
+        _write_cached_info(cache_dir, ticker, info)
 
     trailing_pe = _to_float(info.get("trailingPE"))
     trailing_eps = _to_float(info.get("trailingEps"))
@@ -93,19 +144,33 @@ def fetch_single_fundamental(symbol: str, company_name: str, retries: int = 2) -
 def fetch_fundamentals_for_universe(
     universe_df: pd.DataFrame,
     max_workers: int = 16,
+    cache_dir: str | None = None,
+    cache_ttl_hours: float = 0,
 ) -> pd.DataFrame:
-    rows: list[dict] = []
+    # Accumulate column lists (one per FundamentalRow field) rather than a list of row dicts.
+    cols: dict[str, list] = {name: [] for name in FUNDAMENTAL_FIELDS}
     workers = max(1, min(int(max_workers), 32))
 
     with ThreadPoolExecutor(max_workers=workers) as pool:
         futures = {
-            pool.submit(fetch_single_fundamental, row["symbol"], row["company_name"]): row["symbol"]
-            for _, row in universe_df.iterrows()
+            pool.submit(
+                fetch_single_fundamental,
+                symbol,
+                company_name,
+                cache_dir=cache_dir,
+                cache_ttl_hours=cache_ttl_hours,
+            ): symbol
+            for symbol, company_name in zip(
+                universe_df["symbol"].to_numpy(),
+                universe_df["company_name"].to_numpy(),
+            )
         }
         for fut in as_completed(futures):
             try:
-                rows.append(fut.result().__dict__)
+                row = fut.result()
             except Exception:
                 continue
+            for name, value in vars(row).items():
+                cols[name].append(value)
 
-    return pd.DataFrame(rows)
+    return pd.DataFrame(cols).astype({name: "float64" for name in NUMERIC_FIELDS})
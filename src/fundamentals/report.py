@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
+from src.data.loader import report_source, temp_path, write_report
+from src.fundamentals import _score_numba
 from src.fundamentals.fetcher import fetch_fundamentals_for_universe
 
 
@@ -23,7 +26,9 @@ def _load_universe(universe_csv: str, max_companies: int | None = None) -> pd.Da
     if max_companies is not None:
         u = u.head(int(max_companies))
 
-    return u.reset_index(drop=True)
+    u = u.reset_index(drop=True)
+    u["symbol"] = u["symbol"].astype("category")
+    return u
 
 
 def _load_sentiment(path: str, column_name: str) -> pd.DataFrame:
@@ -35,133 +40,143 @@ def _load_sentiment(path: str, column_name: str) -> pd.DataFrame:
         return pd.DataFrame(columns=["symbol", column_name])
     out = df[["symbol", "avg_sentiment"]].copy()
     out.columns = ["symbol", column_name]
-    out["symbol"] = out["symbol"].astype(str).str.upper().str.strip()
+    out["symbol"] = out["symbol"].astype(str).str.upper().str.strip().astype("category")
     return out
 
 
-def _assess_pe(row: pd.Series) -> str:
-    pe = row.get("trailing_pe")
-    ind_med = row.get("industry_median_pe")
-    if pd.isna(pe) or pe is None or pe <= 0:
-        return "unavailable_or_loss_making"
-    if pd.notna(ind_med) and ind_med > 0:
-        ratio = pe / ind_med
-        if ratio <= 0.9:
-            return "undervalued_vs_industry"
-        if ratio <= 1.2:
-            return "fair_vs_industry"
-        return "overvalued_vs_industry"
-    if pe <= 15:
-        return "low_absolute_pe"
-    if pe <= 25:
-        return "mid_absolute_pe"
-    return "high_absolute_pe"
-
-
-def _score_row(row: pd.Series) -> tuple[int, str]:
-    score = 0
-    reasons: list[str] = []
-
-    pe_assessment = row.get("pe_assessment")
-    if pe_assessment in {"undervalued_vs_industry", "low_absolute_pe"}:
-        score += 2
-        reasons.append("PE favorable")
-    elif pe_assessment in {"fair_vs_industry", "mid_absolute_pe"}:
-        score += 1
-        reasons.append("PE acceptable")
-
-    fpe, tpe = row.get("forward_pe"), row.get("trailing_pe")
-    if pd.notna(fpe) and pd.notna(tpe) and fpe > 0 and tpe > 0 and fpe < tpe:
-        score += 1
-        reasons.append("Forward PE improving")
-
-    peg = row.get("peg_ratio")
-    if pd.notna(peg) and peg > 0:
-        if peg <= 1.2:
-            score += 2
-            reasons.append("PEG attractive")
-        elif peg <= 1.8:
-            score += 1
-            reasons.append("PEG reasonable")
-
-    roe = row.get("return_on_equity")
-    if pd.notna(roe):
-        if roe >= 0.15:
-            score += 2
-            reasons.append("High ROE")
-        elif roe >= 0.10:
-            score += 1
-            reasons.append("Decent ROE")
-
-    margin = row.get("profit_margins")
-    if pd.notna(margin) and margin >= 0.10:
-        score += 1
-        reasons.append("Healthy margins")
-
-    d2e = row.get("debt_to_equity")
-    if pd.notna(d2e):
-        if d2e <= 80:
-            score += 1
-            reasons.append("Manageable debt")
-        elif d2e >= 250:
-            score -= 1
-            reasons.append("High leverage")
-
-    promoter = row.get("promoter_holding_proxy_pct")
-    if pd.notna(promoter):
-        if promoter >= 45:
-            score += 2
-            reasons.append("High insider/promoter proxy")
-        elif promoter >= 25:
-            score += 1
-            reasons.append("Moderate insider/promoter proxy")
-
-    c_sent = row.get("company_news_sentiment")
-    if pd.notna(c_sent):
-        if c_sent >= 0.20:
-            score += 2
-            reasons.append("Strong company news sentiment")
-        elif c_sent >= 0.08:
-            score += 1
-            reasons.append("Positive company news sentiment")
-        elif c_sent <= -0.08:
-            score -= 1
-            reasons.append("Negative company news sentiment")
-
-    ceo_sent = row.get("ceo_commentary_sentiment")
-    if pd.notna(ceo_sent):
-        if ceo_sent >= 0.15:
-            score += 1
-            reasons.append("Positive CEO sentiment")
-        elif ceo_sent <= -0.08:
-            score -= 1
-            reasons.append("Negative CEO sentiment")
-
-    if score >= 8:
-        verdict = "High Potential"
-    elif score >= 5:
-        verdict = "Watchlist"
+def _assess_pe_vectorized(df: pd.DataFrame) -> np.ndarray:
+    # Conditions are checked in order, so each row takes the first matching assessment.
+    pe = pd.to_numeric(df["trailing_pe"], errors="coerce").to_numpy(dtype=np.float64)
+    med = pd.to_numeric(df["industry_median_pe"], errors="coerce").to_numpy(dtype=np.float64)
+    has_med = med > 0
+    ratio = np.divide(pe, med, out=np.full_like(pe, np.nan), where=has_med)
+    conds = [
+        np.isnan(pe) | (pe <= 0),
+        has_med & (ratio <= 0.9),
+        has_med & (ratio <= 1.2),
+        has_med,
+        pe <= 15,
+        pe <= 25,
+    ]
+    # Labels live in _score_numba.PE_ASSESSMENTS so both scorers emit the same strings; the last one is the default.
+    labels = _score_numba.PE_ASSESSMENTS
+    return np.select(conds, list(labels[:-1]), default=labels[-1])
+
+
+def _score_vectorized(df: pd.DataFrame) -> tuple[np.ndarray, list[str]]:
+    # _score_numba.score_all must apply the same rules in this order.
+    def col(name: str) -> np.ndarray:
+        return pd.to_numeric(df[name], errors="coerce").to_numpy(dtype=np.float64)
+
+    pe_assessment = df["pe_assessment"].to_numpy(dtype=object)
+    fpe, tpe = col("forward_pe"), col("trailing_pe")
+    peg = col("peg_ratio")
+    roe = col("return_on_equity")
+    margin = col("profit_margins")
+    d2e = col("debt_to_equity")
+    promoter = col("promoter_holding_proxy_pct")
+    c_sent = col("company_news_sentiment")
+    ceo_sent = col("ceo_commentary_sentiment")
+
+    labels = _score_numba.PE_ASSESSMENTS
+    # (mask, delta) per rule; rule k's reason text is _score_numba.REASONS[k].
+    rules = [
+        (np.isin(pe_assessment, [labels[1], labels[4]]), 2),
+        (np.isin(pe_assessment, [labels[2], labels[5]]), 1),
+        ((fpe > 0) & (tpe > 0) & (fpe < tpe), 1),
+        ((peg > 0) & (peg <= 1.2), 2),
+        ((peg > 1.2) & (peg <= 1.8), 1),
+        (roe >= 0.15, 2),
+        ((roe >= 0.10) & (roe < 0.15), 1),
+        (margin >= 0.10, 1),
+        (d2e <= 80, 1),
+        (d2e >= 250, -1),
+        (promoter >= 45, 2),
+        ((promoter >= 25) & (promoter < 45), 1),
+        (c_sent >= 0.20, 2),
+        ((c_sent >= 0.08) & (c_sent < 0.20), 1),
+        (c_sent <= -0.08, -1),
+        (ceo_sent >= 0.15, 1),
+        (ceo_sent <= -0.08, -1),
+    ]
+    if len(rules) != len(_score_numba.REASONS):
+        raise ValueError("Fundamentals scoring rules and _score_numba.REASONS are out of sync")
+
+    score = np.zeros(len(df), dtype=np.int64)
+    for mask, delta in rules:
+        score += np.where(mask, delta, 0)
+
+    hits = np.column_stack([mask for mask, _ in rules])
+    texts = np.array(_score_numba.REASONS, dtype=object)
+    reasons = ["; ".join(texts[row][:6]) for row in hits]
+    return score, reasons
+
+
+def _score_compiled(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, list[str]]:
+    names = [
+        "trailing_pe",
+        "forward_pe",
+        "peg_ratio",
+        "return_on_equity",
+        "profit_margins",
+        "debt_to_equity",
+        "promoter_holding_proxy_pct",
+        "company_news_sentiment",
+        "ceo_commentary_sentiment",
+        "industry_median_pe",
+    ]
+    cols = [pd.to_numeric(df[n], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan) for n in names]
+    n = len(df)
+    score = np.zeros(n, dtype=np.int64)
+    pe_code = np.zeros(n, dtype=np.int64)
+    reason_mask = np.zeros((n, len(_score_numba.REASONS)), dtype=np.bool_)
+    kernel = _score_numba.score_all_parallel if n >= _score_numba.PARALLEL_MIN_ROWS else _score_numba.score_all
+    kernel(*cols, score, pe_code, reason_mask)
+
+    texts = np.array(_score_numba.REASONS, dtype=object)
+    reasons = ["; ".join(texts[row][:6]) for row in reason_mask]
+    return np.array(_score_numba.PE_ASSESSMENTS, dtype=object)[pe_code], score, reasons
+
+
+def _merge_with_cache(fresh: pd.DataFrame, raw_csv: str) -> pd.DataFrame:
+    # write_report keeps a Parquet sibling of the raw CSV; prefer it over reparsing the CSV unless it is stale.
+    src = report_source(raw_csv)
+    if not src.exists():
+        cached = None
+    elif src.suffix == ".parquet":
+        cached = pd.read_parquet(src)
     else:
-        verdict = "Avoid/Needs Work"
-
-    return score, "; ".join(reasons[:6])
-
-
-def _merge_with_cache(universe: pd.DataFrame, fresh: pd.DataFrame, raw_csv: str) -> pd.DataFrame:
-    p = Path(raw_csv)
-    if p.exists():
-        cached = pd.read_csv(p)
-        if "symbol" in cached.columns:
-            cached["symbol"] = cached["symbol"].astype(str).str.upper().str.strip()
-            fresh["symbol"] = fresh["symbol"].astype(str).str.upper().str.strip()
-            merged = pd.concat([cached, fresh], ignore_index=True)
-            merged = merged.drop_duplicates(subset=["symbol"], keep="last")
-        else:
-            merged = fresh
-    else:
-        merged = fresh
-
-    return universe[["symbol"]].merge(merged, on="symbol", how="left")
+        cached = pd.read_csv(src)
+
+    fresh_i = fresh.set_index("symbol")
+    if cached is None or "symbol" not in cached.columns:
+        return fresh_i
+
+    cached["symbol"] = cached["symbol"].astype(str).str.upper().str.strip()
+    fresh_i.index = fresh_i.index.astype(str).str.upper().str.strip()
+    cached_i = cached.drop_duplicates(subset=["symbol"], keep="last").set_index("symbol")
+    # Fresh values win; cached values only fill fields the fresh fetch left empty.
+    columns = list(fresh_i.columns) + [c for c in cached_i.columns if c not in fresh_i.columns]
+    return fresh_i.combine_first(cached_i)[columns]
+
+
+def _write_summary(df: pd.DataFrame, json_path: str) -> None:
+    # Tiny KPI file so the UI can show category counts without scanning the ranked report.
+    counts = df["return_potential_flag"].value_counts()
+    summary = {
+        "high": int(counts.get("High Potential", 0)),
+        "watchlist": int(counts.get("Watchlist", 0)),
+        "avoid": int(counts.get("Avoid/Needs Work", 0)),
+        "total": int(len(df)),
+    }
+    p = Path(json_path)
+    tmp = temp_path(p)
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(summary, f)
+        tmp.replace(p)
+    finally:
+        tmp.unlink(missing_ok=True)
 
 
 def generate_fundamentals_report(cfg: dict) -> pd.DataFrame:
@@ -170,6 +185,8 @@ def generate_fundamentals_report(cfg: dict) -> pd.DataFrame:
     fresh = fetch_fundamentals_for_universe(
         universe_df=universe,
         max_workers=cfg.get("max_workers", 16),
+        cache_dir=cfg.get("info_cache_dir"),
+        cache_ttl_hours=float(cfg.get("info_cache_ttl_hours") or 0),
     )
 
     out_cfg = cfg["outputs"]
@@ -177,29 +194,31 @@ def generate_fundamentals_report(cfg: dict) -> pd.DataFrame:
 
     use_cache = bool(cfg.get("use_cache", False))
     if use_cache:
-        merged_fund = _merge_with_cache(universe, fresh, out_cfg["raw_fundamentals_csv"])
+        merged_fund = _merge_with_cache(fresh, out_cfg["raw_fundamentals_csv"])
     else:
-        merged_fund = universe[["symbol"]].merge(fresh, on="symbol", how="left")
-    merged_fund.to_csv(out_cfg["raw_fundamentals_csv"], index=False)
+        merged_fund = fresh.set_index("symbol")
+    merged_fund = merged_fund.reindex(pd.Index(universe["symbol"], name="symbol"))
+    write_report(merged_fund.reset_index(), out_cfg["raw_fundamentals_csv"])
 
-    df = universe.merge(merged_fund, on="symbol", how="left", suffixes=("", "_dup"))
-    if "company_name_dup" in df.columns:
-        df = df.drop(columns=["company_name_dup"])
+    # The universe's company_name is authoritative; drop the fetched copy instead of suffixing it.
+    df = universe.join(merged_fund.drop(columns=["company_name"], errors="ignore"), on="symbol")
 
-    valid_pe = df[(df["trailing_pe"].notna()) & (df["trailing_pe"] > 0)]
-    industry_med = valid_pe.groupby("industry")["trailing_pe"].median().rename("industry_median_pe")
-    df = df.merge(industry_med, on="industry", how="left")
+    df["industry"] = df["industry"].astype("category")
+    pe = df["trailing_pe"].where(df["trailing_pe"] > 0)
+    df["industry_median_pe"] = pe.groupby(df["industry"], observed=True).transform("median")
 
-    company_sent = _load_sentiment(cfg["company_sentiment_csv"], "company_news_sentiment")
-    ceo_sent = _load_sentiment(cfg["ceo_sentiment_csv"], "ceo_commentary_sentiment")
+    # Give the sentiment keys the universe's categories so the merges match on codes, not strings.
+    symbols = df["symbol"].dtype
+    company_sent = _load_sentiment(cfg["company_sentiment_csv"], "company_news_sentiment").astype({"symbol": symbols})
+    ceo_sent = _load_sentiment(cfg["ceo_sentiment_csv"], "ceo_commentary_sentiment").astype({"symbol": symbols})
     df = df.merge(company_sent, on="symbol", how="left")
     df = df.merge(ceo_sent, on="symbol", how="left")
 
-    df["pe_assessment"] = df.apply(_assess_pe, axis=1)
-
-    scored = df.apply(_score_row, axis=1)
-    df["score"] = [x[0] for x in scored]
-    df["reason_summary"] = [x[1] for x in scored]
+    if _score_numba.NUMBA_AVAILABLE:
+        df["pe_assessment"], df["score"], df["reason_summary"] = _score_compiled(df)
+    else:
+        df["pe_assessment"] = _assess_pe_vectorized(df)
+        df["score"], df["reason_summary"] = _score_vectorized(df)
     df["return_potential_flag"] = np.where(
         df["score"] >= 8,
         "High Potential",
@@ -211,8 +230,10 @@ def generate_fundamentals_report(cfg: dict) -> pd.DataFrame:
         ascending=[False, False, False, False],
     )
 
-    df.to_csv(out_cfg["ranked_report_csv"], index=False)
+    write_report(df, out_cfg["ranked_report_csv"])
     top_n = int(cfg.get("top_n", 50))
-    df.head(top_n).to_csv(out_cfg["top_picks_csv"], index=False)
+    write_report(df.head(top_n), out_cfg["top_picks_csv"])
+    if out_cfg.get("summary_json"):
+        _write_summary(df, out_cfg["summary_json"])
 
     return df
@@ -1,4 +1,8 @@
 import argparse
+import logging
+import sys
+
+import numpy as np
 import yaml
 
 from src.data.loader import load_prices
@@ -11,6 +15,8 @@ from src.news.report import generate_30d_news_and_ceo_reports
 from src.news.policy_report import generate_policy_benefit_report
 from src.fundamentals.report import generate_fundamentals_report
 
+LOGGER = logging.getLogger(__name__)
+
 
 def build_features(cfg):
     df = load_prices(cfg["data"]["raw_prices_path"])
@@ -26,47 +32,47 @@ def train(cfg):
     split = int(len(tf) * (1 - cfg["model"]["test_size"]))
     tr, te = tf.iloc[:split], tf.iloc[split:]
     model = fit_model(tr)
-    acc = (model.predict(te[FEATURES]) == te["target"]).mean() if len(te) else 0.0
-    print(f"Train={len(tr)} Test={len(te)} Accuracy={acc:.4f}")
+    acc = (model.predict(te[FEATURES].to_numpy(dtype=np.float32)) == te["target"]).mean() if len(te) else 0.0
+    LOGGER.info(f"Train={len(tr)} Test={len(te)} Accuracy={acc:.4f}")
 
 
 def backtest(cfg):
     df = build_features(cfg)
     tf = prepare_training_frame(df, horizon=cfg["model"]["target_horizon"])
     model = fit_model(tf.iloc[: max(1, int(len(tf) * 0.7))])
-    tf["proba"] = model.predict_proba(tf[FEATURES])[:, 1]
+    tf["proba"] = model.predict_proba(tf[FEATURES].to_numpy(dtype=np.float32))[:, 1]
     tf["weight"] = apply_risk_overlay(tf["proba"], cfg["risk"]["max_weight_per_stock"])
     res = run_backtest(tf, "weight")
-    print(f"Sharpe={res['sharpe']:.4f}")
+    LOGGER.info(f"Sharpe={res['sharpe']:.4f}")
 
 
 def news_report(cfg):
     company_summary, ceo_summary = generate_30d_news_and_ceo_reports(cfg["news"])
 
-    print("\n30-Day Company News Sentiment")
+    LOGGER.info("\n30-Day Company News Sentiment")
     if company_summary.empty:
-        print("No company news found in lookback window.")
+        LOGGER.info("No company news found in lookback window.")
     else:
-        print(company_summary.head(20).to_string(index=False))
+        LOGGER.info(company_summary.head(20).to_string(index=False))
 
-    print("\n30-Day CEO Commentary Sentiment")
+    LOGGER.info("\n30-Day CEO Commentary Sentiment")
     if ceo_summary.empty:
-        print("No CEO commentary news found in lookback window.")
+        LOGGER.info("No CEO commentary news found in lookback window.")
     else:
-        print(ceo_summary.head(20).to_string(index=False))
+        LOGGER.info(ceo_summary.head(20).to_string(index=False))
 
     outputs = cfg["news"]["outputs"]
-    print("\nSaved files:")
-    print(f"- {outputs['company_summary_csv']}")
-    print(f"- {outputs['company_details_csv']}")
-    print(f"- {outputs['ceo_summary_csv']}")
-    print(f"- {outputs['ceo_details_csv']}")
+    LOGGER.info("\nSaved files:")
+    LOGGER.info(f"- {outputs['company_summary_csv']}")
+    LOGGER.info(f"- {outputs['company_details_csv']}")
+    LOGGER.info(f"- {outputs['ceo_summary_csv']}")
+    LOGGER.info(f"- {outputs['ceo_details_csv']}")
 
 
 def policy_report(cfg):
     rep = generate_policy_benefit_report(cfg["policy"])
     if rep.empty:
-        print("\nPolicy beneficiary report is empty.")
+        LOGGER.info("\nPolicy beneficiary report is empty.")
     else:
         cols = [
             "symbol",
@@ -77,13 +83,13 @@ def policy_report(cfg):
             "matched_categories",
         ]
         show_cols = [c for c in cols if c in rep.columns]
-        print("\nPolicy Beneficiary Stocks (Top 30)")
-        print(rep[show_cols].head(30).to_string(index=False))
+        LOGGER.info("\nPolicy Beneficiary Stocks (Top 30)")
+        LOGGER.info(rep[show_cols].head(30).to_string(index=False))
 
     out = cfg["policy"]["outputs"]
-    print("\nSaved files:")
-    print(f"- {out['summary_csv']}")
-    print(f"- {out['evidence_csv']}")
+    LOGGER.info("\nSaved files:")
+    LOGGER.info(f"- {out['summary_csv']}")
+    LOGGER.info(f"- {out['evidence_csv']}")
 
 
 def fundamentals_report(cfg):
@@ -102,13 +108,15 @@ def fundamentals_report(cfg):
         "reason_summary",
     ]
     show_cols = [c for c in cols if c in rep.columns]
-    print("\nFundamentals + Sentiment Ranked Report (Top 30)")
-    print(rep[show_cols].head(30).to_string(index=False))
+    LOGGER.info("\nFundamentals + Sentiment Ranked Report (Top 30)")
+    LOGGER.info(rep[show_cols].head(30).to_string(index=False))
     out = cfg["fundamentals"]["outputs"]
-    print("\nSaved files:")
-    print(f"- {out['raw_fundamentals_csv']}")
-    print(f"- {out['ranked_report_csv']}")
-    print(f"- {out['top_picks_csv']}")
+    LOGGER.info("\nSaved files:")
+    LOGGER.info(f"- {out['raw_fundamentals_csv']}")
+    LOGGER.info(f"- {out['ranked_report_csv']}")
+    LOGGER.info(f"- {out['top_picks_csv']}")
+    if out.get("summary_json"):
+        LOGGER.info(f"- {out['summary_json']}")
 
 
 def main():
@@ -116,6 +124,7 @@ def main():
     p.add_argument("command", choices=["train", "backtest", "news_report", "policy_report", "fundamentals_report"])
     p.add_argument("--config", required=True)
     args = p.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     cfg = yaml.safe_load(open(args.config))
 
     if args.command == "train":
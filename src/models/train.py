@@ -1,14 +1,28 @@
-from sklearn.ensemble import RandomForestClassifier
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import HistGradientBoostingClassifier
 
 FEATURES = ["ret_1d", "mom_ma", "rsi", "sentiment"]
 
 def prepare_training_frame(df, horizon=1):
     out = df.copy()
-    out["fwd_ret"] = out.groupby("symbol")["close"].pct_change(horizon).shift(-horizon)
-    out["target"] = (out["fwd_ret"] > 0).astype(int)
+    codes, _ = pd.factorize(out["symbol"])
+    # Stable sort keeps each symbol's rows in their existing order; steps that cross a symbol boundary are masked.
+    order = np.argsort(codes, kind="stable")
+    close = out["close"].to_numpy(dtype=np.float64)[order]
+    sym = codes[order]
+    fwd_sorted = np.full_like(close, np.nan)
+    if 0 < horizon < len(close):
+        same = (sym[:-horizon] == sym[horizon:]) & (sym[:-horizon] >= 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fwd_sorted[:-horizon] = np.where(same, close[horizon:] / close[:-horizon] - 1.0, np.nan)
+    fwd = np.empty_like(fwd_sorted)
+    fwd[order] = fwd_sorted
+    out["fwd_ret"] = fwd
+    out["target"] = (fwd > 0).astype(np.int8)
     return out.dropna(subset=FEATURES + ["target"])
 
 def fit_model(train_df):
-    model = RandomForestClassifier(n_estimators=200, random_state=42)
-    model.fit(train_df[FEATURES], train_df["target"])
+    model = HistGradientBoostingClassifier(max_iter=200, learning_rate=0.1, max_bins=255, random_state=42)
+    model.fit(train_df[FEATURES].to_numpy(dtype=np.float32), train_df["target"].to_numpy())
     return model
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.data.loader import temp_path
+
+
+def title_hash(title: str) -> int:
+    digest = hashlib.blake2b(str(title).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+def load_cache(path: str | Path) -> dict[int, float]:
+    p = Path(path)
+    if not p.exists():
+        return {}
+    try:
+        df = pd.read_parquet(p)
+        return dict(zip(df["title_hash"].tolist(), df["score"].tolist()))
+    except Exception:
+        return {}
+
+
+def save_cache(path: str | Path, cache: dict[int, float]) -> None:
+    p = Path(path)
+    # Scores stay float64 so cached runs write byte-identical details CSVs.
+    df = pd.DataFrame(
+        {
+            "title_hash": np.fromiter(cache.keys(), dtype=np.int64, count=len(cache)),
+            "score": np.fromiter(cache.values(), dtype=np.float64, count=len(cache)),
+        }
+    )
+    tmp = temp_path(p)
+    try:
+        p.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(tmp, index=False)
+        tmp.replace(p)
+    except Exception:
+        tmp.unlink(missing_ok=True)
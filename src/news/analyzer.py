@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
 
@@ -11,6 +13,10 @@ class SentimentResult:
     score: float
 
 
+def sentiment_labels(scores: np.ndarray) -> np.ndarray:
+    return np.select([scores >= 0.05, scores <= -0.05], ["positive", "negative"], default="neutral")
+
+
 class NewsSentimentAnalyzer:
     def __init__(self) -> None:
         self._analyzer = SentimentIntensityAnalyzer()
@@ -24,3 +30,10 @@ class NewsSentimentAnalyzer:
         else:
             label = "neutral"
         return SentimentResult(label=label, score=compound)
+
+    def analyze_many(self, titles: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        polarity_scores = self._analyzer.polarity_scores
+        scores = np.empty(len(titles), dtype=np.float64)
+        for i, text in enumerate(titles):
+            scores[i] = polarity_scores(text).get("compound", 0.0)
+        return scores, sentiment_labels(scores)
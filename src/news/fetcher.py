@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from typing import List
 from urllib.parse import quote_plus
 
 import feedparser
+import numpy as np
+import pandas as pd
+from curl_cffi.requests import AsyncSession
 
 
 @dataclass
@@ -21,6 +24,7 @@ class NewsItem:
 
 
 GOOGLE_NEWS_RSS = "https://news.google.com/rss/search?q={query}&hl=en-IN&gl=IN&ceid=IN:en"
+RFC822_FORMATS = ("%a, %d %b %Y %H:%M:%S %Z", "%a, %d %b %Y %H:%M:%S %z")
 
 
 def _normalize_google_news_link(url: str) -> str:
@@ -45,22 +49,42 @@ def _parse_published(value: str) -> datetime | None:
         return None
 
 
-def fetch_google_news(symbol: str, query: str, limit: int = 30, lookback_days: int = 30) -> List[NewsItem]:
+def _google_news_url(query: str, lookback_days: int) -> str:
     q = query.strip()
     if "when:" not in q:
         q = f"{q} when:{lookback_days}d"
+    return GOOGLE_NEWS_RSS.format(query=quote_plus(q))
 
-    url = GOOGLE_NEWS_RSS.format(query=quote_plus(q))
-    feed = feedparser.parse(url)
 
-    cutoff = datetime.now(timezone.utc) - timedelta(days=lookback_days)
-    items: List[NewsItem] = []
-    for entry in feed.entries:
-        published = getattr(entry, "published", "")
-        published_at = _parse_published(published)
+def _parse_published_many(values: list[str]) -> pd.Series:
+    raw = pd.Series(values, dtype=object).fillna("")
+    present = raw.astype(bool)
+    parsed = pd.Series(pd.NaT, index=raw.index, dtype="datetime64[ns, UTC]")
+    for fmt in RFC822_FORMATS:
+        todo = present & parsed.isna()
+        if not todo.any():
+            break
+        parsed[todo] = pd.to_datetime(raw[todo], utc=True, errors="coerce", format=fmt)
+    # Rarer RFC 822 shapes (legacy zone names, no weekday) still go through the email parser.
+    for i in np.flatnonzero((present & parsed.isna()).to_numpy()):
+        dt = _parse_published(raw.iat[i])
+        if dt is not None:
+            parsed.iat[i] = dt
+    return parsed
+
 
-        if published_at is not None and published_at < cutoff:
-            continue
+def _feed_items(symbol: str, feed, limit: int, lookback_days: int) -> List[NewsItem]:
+    entries = list(feed.entries)
+    published = [getattr(entry, "published", "") for entry in entries]
+    published_at = _parse_published_many(published)
+
+    cutoff = pd.Timestamp.now(tz="UTC") - pd.Timedelta(days=lookback_days)
+    keep = (published_at.isna() | (published_at >= cutoff)).to_numpy()
+
+    items: List[NewsItem] = []
+    for i in np.flatnonzero(keep)[:limit]:
+        entry = entries[i]
+        ts = published_at.iat[i]
 
         source = ""
         if hasattr(entry, "source") and isinstance(entry.source, dict):
@@ -71,44 +95,65 @@ def fetch_google_news(symbol: str, query: str, limit: int = 30, lookback_days: i
                 symbol=symbol,
                 title=getattr(entry, "title", ""),
                 link=_normalize_google_news_link(getattr(entry, "link", "")),
-                published=published,
+                published=published[i],
                 source=source,
-                published_at=published_at,
+                published_at=None if pd.isna(ts) else ts.to_pydatetime(),
             )
         )
-        if len(items) >= limit:
-            break
 
     return items
 
 
-def fetch_news_for_queries(
+async def _fetch_feed(session: AsyncSession, url: str):
+    resp = await session.get(url, timeout=20)
+    # Parse from bytes so feedparser does not open its own blocking connection.
+    return feedparser.parse(resp.content)
+
+
+async def fetch_news_for_queries_async(
     symbol_to_query: dict[str, str],
     lookback_days: int = 30,
     limit_per_symbol: int = 30,
     max_workers: int = 12,
+    feed_cache: dict | None = None,
 ) -> List[NewsItem]:
     all_items: List[NewsItem] = []
     if not symbol_to_query:
         return all_items
 
-    workers = max(1, min(max_workers, 32))
-    with ThreadPoolExecutor(max_workers=workers) as pool:
-        futures = {
-            pool.submit(
-                fetch_google_news,
-                symbol=symbol,
-                query=query,
-                limit=limit_per_symbol,
-                lookback_days=lookback_days,
-            ): symbol
-            for symbol, query in symbol_to_query.items()
-        }
-
-        for fut in as_completed(futures):
-            try:
-                all_items.extend(fut.result())
-            except Exception:
-                continue
-
+    # Feeds are keyed by URL, so identical queries download once; pass one feed_cache across calls to share them.
+    feeds = {} if feed_cache is None else feed_cache
+    urls = {symbol: _google_news_url(query, lookback_days) for symbol, query in symbol_to_query.items()}
+    pending = [url for url in dict.fromkeys(urls.values()) if url not in feeds]
+
+    if pending:
+        # max_workers now caps concurrent connections on a single event loop.
+        clients = max(1, min(max_workers, 32))
+        async with AsyncSession(max_clients=clients, impersonate="chrome") as session:
+            results = await asyncio.gather(*[_fetch_feed(session, url) for url in pending], return_exceptions=True)
+        for url, result in zip(pending, results):
+            if not isinstance(result, BaseException):
+                feeds[url] = result
+
+    for symbol, url in urls.items():
+        if url in feeds:
+            all_items.extend(_feed_items(symbol, feeds[url], limit_per_symbol, lookback_days))
     return all_items
+
+
+def fetch_news_for_queries(
+    symbol_to_query: dict[str, str],
+    lookback_days: int = 30,
+    limit_per_symbol: int = 30,
+    max_workers: int = 12,
+    feed_cache: dict | None = None,
+) -> List[NewsItem]:
+    return asyncio.run(
+        fetch_news_for_queries_async(
+            symbol_to_query,
+            lookback_days=lookback_days,
+            limit_per_symbol=limit_per_symbol,
+            max_workers=max_workers,
+            feed_cache=feed_cache,
+        )
+    )
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from src.data.loader import write_report
+
 
 DEFAULT_POLICY_KEYWORDS: dict[str, list[str]] = {
     "capex_infra": [
@@ -76,21 +80,16 @@ def _normalize_keywords(raw: Any) -> dict[str, list[str]]:
     return out or DEFAULT_POLICY_KEYWORDS
 
 
-def _matches(text: str, keywords: dict[str, list[str]]) -> list[str]:
-    t = (text or "").lower()
-    hits: list[str] = []
-    for cat, words in keywords.items():
-        if any(w in t for w in words):
-            hits.append(cat)
-    return hits
-
-
-def _bucket(score: float, mentions: int) -> str:
-    if mentions >= 5 and score >= 8:
-        return "High Policy Benefit"
-    if mentions >= 2 and score >= 4:
-        return "Potential Beneficiary"
-    return "Watch"
+def _category_hits(titles: pd.Series, keywords: dict[str, list[str]]) -> tuple[np.ndarray, np.ndarray]:
+    # Sorted so each row's matched categories come out already ordered.
+    cats = np.array(sorted(keywords), dtype=object)
+    hits = np.zeros((len(titles), len(cats)), dtype=bool)
+    for j, cat in enumerate(cats):
+        words = keywords[cat]
+        if words:
+            pattern = re.compile("|".join(re.escape(w) for w in words), re.IGNORECASE)
+            hits[:, j] = titles.str.contains(pattern, regex=True, na=False).to_numpy()
+    return cats, hits
 
 
 def generate_policy_benefit_report(cfg: dict) -> pd.DataFrame:
@@ -133,14 +132,17 @@ def generate_policy_benefit_report(cfg: dict) -> pd.DataFrame:
             ]
         )
         Path(outputs["summary_csv"]).parent.mkdir(parents=True, exist_ok=True)
-        empty_summary.to_csv(outputs["summary_csv"], index=False)
-        empty_evidence.to_csv(outputs["evidence_csv"], index=False)
+        write_report(empty_summary, outputs["summary_csv"])
+        write_report(empty_evidence, outputs["evidence_csv"], sort_by="symbol")
         return empty_summary
 
     work = details.copy()
+    work["symbol"] = work["symbol"].astype("category")
     work["sentiment_score"] = pd.to_numeric(work["sentiment_score"], errors="coerce").fillna(0.0)
-    work["matched_categories_list"] = work["title"].astype(str).apply(lambda t: _matches(t, keywords))
-    work = work[work["matched_categories_list"].map(len) > 0].copy()
+    cats, hits = _category_hits(work["title"].astype(str), keywords)
+    matched = hits.any(axis=1)
+    work = work[matched].copy()
+    hits = hits[matched]
 
     if work.empty:
         empty_summary = pd.DataFrame(
@@ -155,12 +157,12 @@ def generate_policy_benefit_report(cfg: dict) -> pd.DataFrame:
             ]
         )
         Path(outputs["summary_csv"]).parent.mkdir(parents=True, exist_ok=True)
-        empty_summary.to_csv(outputs["summary_csv"], index=False)
-        work.to_csv(outputs["evidence_csv"], index=False)
+        write_report(empty_summary, outputs["summary_csv"])
+        write_report(work, outputs["evidence_csv"], sort_by="symbol")
         return empty_summary
 
-    work["matched_categories"] = work["matched_categories_list"].apply(lambda x: ", ".join(sorted(set(x))))
-    work["keyword_hit_count"] = work["matched_categories_list"].apply(lambda x: len(set(x)))
+    work["matched_categories"] = [", ".join(cats[row]) for row in hits]
+    work["keyword_hit_count"] = hits.sum(axis=1)
     # Policy row score: keyword coverage + positive sentiment boost.
     work["policy_row_score"] = work["keyword_hit_count"] * 1.5 + work["sentiment_score"].clip(lower=0.0) * 2.0
 
@@ -176,33 +178,36 @@ def generate_policy_benefit_report(cfg: dict) -> pd.DataFrame:
     ]
     evidence = work[evidence_cols].sort_values(["policy_row_score", "sentiment_score"], ascending=[False, False])
 
-    grouped = work.groupby("symbol", as_index=False).agg(
+    grouped = work.groupby("symbol", as_index=False, observed=True).agg(
         scheme_mentions=("title", "count"),
         avg_scheme_sentiment=("sentiment_score", "mean"),
         policy_benefit_score=("policy_row_score", "sum"),
     )
 
-    cat_map = (
-        work.groupby("symbol")["matched_categories_list"]
-        .apply(lambda s: ", ".join(sorted(set([c for row in s for c in row]))))
-        .reset_index(name="matched_categories")
-    )
+    symbol_hits = pd.DataFrame(hits, index=work.index).groupby(work["symbol"], observed=True).any()
+    cat_map = pd.Series(
+        [", ".join(cats[row]) for row in symbol_hits.to_numpy()], index=symbol_hits.index
+    ).reset_index(name="matched_categories")
 
     link_map = (
-        work.groupby("symbol")["link"]
+        work.groupby("symbol", observed=True)["link"]
         .apply(lambda s: " | ".join(list(dict.fromkeys([x for x in s if isinstance(x, str) and x]))[:3]))
         .reset_index(name="top_links")
     )
 
     summary = grouped.merge(cat_map, on="symbol", how="left").merge(link_map, on="symbol", how="left")
-    summary["benefit_bucket"] = summary.apply(
-        lambda r: _bucket(float(r["policy_benefit_score"]), int(r["scheme_mentions"])), axis=1
+    score = summary["policy_benefit_score"].to_numpy(dtype=np.float64)
+    mentions = summary["scheme_mentions"].to_numpy()
+    summary["benefit_bucket"] = np.select(
+        [(mentions >= 5) & (score >= 8), (mentions >= 2) & (score >= 4)],
+        ["High Policy Benefit", "Potential Beneficiary"],
+        default="Watch",
     )
 
     summary = summary.sort_values(["policy_benefit_score", "scheme_mentions", "avg_scheme_sentiment"], ascending=[False, False, False])
 
     Path(outputs["summary_csv"]).parent.mkdir(parents=True, exist_ok=True)
-    summary.to_csv(outputs["summary_csv"], index=False)
-    evidence.to_csv(outputs["evidence_csv"], index=False)
+    write_report(summary, outputs["summary_csv"])
+    write_report(evidence, outputs["evidence_csv"], sort_by="symbol")
 
     return summary
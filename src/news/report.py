@@ -2,39 +2,40 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
-from src.news.analyzer import NewsSentimentAnalyzer
+from src.data.loader import write_report
+from src.news._sentiment_cache import load_cache, save_cache, title_hash
+from src.news.analyzer import NewsSentimentAnalyzer, sentiment_labels
 from src.news.fetcher import fetch_news_for_queries
 
 
-def _safe_links(series: pd.Series, top_n: int = 3) -> str:
-    links = [x for x in series.tolist() if isinstance(x, str) and x.strip()]
-    return " | ".join(list(dict.fromkeys(links))[:top_n])
-
-
-def _vibe(score: float) -> str:
-    if score >= 0.05:
-        return "positive vibe"
-    if score <= -0.05:
-        return "negative vibe"
-    return "neutral vibe"
+def _top_links(details_df: pd.DataFrame, symbol_col: str = "symbol", top_n: int = 3) -> pd.Series:
+    # Non-string links (NaN from empty CSV cells) drop out as NaN under .str.
+    valid = details_df["link"].astype(object).str.strip().fillna("").ne("")
+    links = details_df.loc[valid, [symbol_col, "link"]].drop_duplicates()
+    return links.groupby(symbol_col).head(top_n).groupby(symbol_col)["link"].agg(" | ".join)
 
 
 def _summarize(details_df: pd.DataFrame, symbol_col: str = "symbol") -> pd.DataFrame:
+    # One-hot label columns let the counts run as plain groupby sums.
+    onehot = pd.get_dummies(details_df["sentiment_label"]).reindex(columns=["positive", "neutral", "negative"], fill_value=False)
+    work = pd.concat([details_df[[symbol_col, "title", "sentiment_score"]], onehot], axis=1)
     summary = (
-        details_df.groupby(symbol_col)
+        work.groupby(symbol_col)
         .agg(
             news_count=("title", "count"),
-            positive_count=("sentiment_label", lambda s: int((s == "positive").sum())),
-            neutral_count=("sentiment_label", lambda s: int((s == "neutral").sum())),
-            negative_count=("sentiment_label", lambda s: int((s == "negative").sum())),
+            positive_count=("positive", "sum"),
+            neutral_count=("neutral", "sum"),
+            negative_count=("negative", "sum"),
             avg_sentiment=("sentiment_score", "mean"),
-            top_links=("link", _safe_links),
         )
         .reset_index()
     )
-    summary["vibe"] = summary["avg_sentiment"].apply(_vibe)
+    summary["top_links"] = summary[symbol_col].map(_top_links(details_df, symbol_col)).fillna("")
+    avg = summary["avg_sentiment"].to_numpy(dtype=np.float64)
+    summary["vibe"] = np.select([avg >= 0.05, avg <= -0.05], ["positive vibe", "negative vibe"], default="neutral vibe")
     return summary.sort_values(["avg_sentiment", "news_count"], ascending=[False, False]).reset_index(drop=True)
 
 
@@ -43,35 +44,64 @@ def _existing_non_empty(csv_path: str) -> pd.DataFrame:
     if not p.exists():
         return pd.DataFrame()
     try:
-        df = pd.read_csv(p)
+        df = pd.read_csv(p, engine="pyarrow")
         return df if not df.empty else pd.DataFrame()
     except Exception:
         return pd.DataFrame()
 
 
-def _write_output(new_df: pd.DataFrame, csv_path: str, preserve_non_empty: bool) -> pd.DataFrame:
+def _write_output(
+    new_df: pd.DataFrame,
+    csv_path: str,
+    preserve_non_empty: bool,
+    sort_by: str | None = None,
+) -> pd.DataFrame:
     p = Path(csv_path)
     p.parent.mkdir(parents=True, exist_ok=True)
 
     # Fresh mode: always overwrite, even with empty result.
     if not preserve_non_empty:
-        new_df.to_csv(csv_path, index=False)
+        write_report(new_df, csv_path, sort_by=sort_by)
         return new_df
 
     # Preserve mode: keep old non-empty files if new result is empty.
     if not new_df.empty:
-        new_df.to_csv(csv_path, index=False)
+        write_report(new_df, csv_path, sort_by=sort_by)
         return new_df
 
     existing = _existing_non_empty(csv_path)
     if not existing.empty:
         return existing
 
-    new_df.to_csv(csv_path, index=False)
+    write_report(new_df, csv_path, sort_by=sort_by)
     return new_df
 
 
-def _analyze_items(items: list[dict], output_details_csv: str, preserve_non_empty: bool) -> pd.DataFrame:
+def _score_titles(
+    titles: list[str],
+    analyzer: NewsSentimentAnalyzer,
+    cache: dict[int, float] | None,
+) -> tuple[np.ndarray, np.ndarray]:
+    if cache is None:
+        return analyzer.analyze_many(titles)
+
+    keys = [title_hash(t) for t in titles]
+    scores = np.array([cache.get(k, np.nan) for k in keys], dtype=np.float64)
+    misses = np.flatnonzero(np.isnan(scores))
+    if misses.size:
+        fresh, _ = analyzer.analyze_many([titles[i] for i in misses])
+        scores[misses] = fresh
+        cache.update(zip((keys[i] for i in misses), fresh.tolist()))
+    return scores, sentiment_labels(scores)
+
+
+def _analyze_items(
+    items: list[dict],
+    output_details_csv: str,
+    preserve_non_empty: bool,
+    analyzer: NewsSentimentAnalyzer,
+    cache: dict[int, float] | None = None,
+) -> pd.DataFrame:
     if not items:
         empty = pd.DataFrame(
             columns=[
@@ -84,26 +114,22 @@ def _analyze_items(items: list[dict], output_details_csv: str, preserve_non_empt
                 "sentiment_score",
             ]
         )
-        return _write_output(empty, output_details_csv, preserve_non_empty)
-
-    analyzer = NewsSentimentAnalyzer()
-    rows = []
-    for item in items:
-        result = analyzer.analyze(item["title"])
-        rows.append(
-            {
-                "symbol": item["symbol"],
-                "title": item["title"],
-                "link": item["link"],
-                "published": item["published"],
-                "source": item["source"],
-                "sentiment_label": result.label,
-                "sentiment_score": result.score,
-            }
-        )
-
-    details_df = pd.DataFrame(rows)
-    return _write_output(details_df, output_details_csv, preserve_non_empty)
+        return _write_output(empty, output_details_csv, preserve_non_empty, sort_by="symbol")
+
+    titles = [item["title"] for item in items]
+    scores, labels = _score_titles(titles, analyzer, cache)
+    details_df = pd.DataFrame(
+        {
+            "symbol": [item["symbol"] for item in items],
+            "title": titles,
+            "link": [item["link"] for item in items],
+            "published": [item["published"] for item in items],
+            "source": [item["source"] for item in items],
+            "sentiment_label": pd.Categorical(labels, categories=["positive", "neutral", "negative"]),
+            "sentiment_score": scores,
+        }
+    )
+    return _write_output(details_df, output_details_csv, preserve_non_empty, sort_by="symbol")
 
 
 def _load_companies(news_cfg: dict) -> list[dict]:
@@ -160,17 +186,21 @@ def generate_30d_news_and_ceo_reports(news_cfg: dict) -> tuple[pd.DataFrame, pd.
         ceo_topic = f'"{ceo_name}" "{company_name}"' if ceo_name else f'"{company_name}" CEO'
         ceo_queries[symbol] = f"{ceo_topic} commentary OR interview OR says OR guidance"
 
+    # Shared by both passes so a query repeated across them is downloaded once per run.
+    feed_cache: dict = {}
     company_items_raw = fetch_news_for_queries(
         symbol_to_query=company_queries,
         lookback_days=lookback_days,
         limit_per_symbol=limit_per_company,
         max_workers=max_workers,
+        feed_cache=feed_cache,
     )
     ceo_items_raw = fetch_news_for_queries(
         symbol_to_query=ceo_queries,
         lookback_days=lookback_days,
         limit_per_symbol=limit_per_company,
         max_workers=max_workers,
+        feed_cache=feed_cache,
     )
 
     company_items = [item.__dict__ for item in company_items_raw]
@@ -178,8 +208,17 @@ def generate_30d_news_and_ceo_reports(news_cfg: dict) -> tuple[pd.DataFrame, pd.
 
     outputs = news_cfg["outputs"]
 
-    company_details = _analyze_items(company_items, outputs["company_details_csv"], preserve_non_empty)
-    ceo_details = _analyze_items(ceo_items, outputs["ceo_details_csv"], preserve_non_empty)
+    # One analyzer for both passes; building the VADER lexicon is the expensive part.
+    analyzer = NewsSentimentAnalyzer()
+    # Titles repeat across refreshes, so VADER scores are memoized on disk by title hash.
+    cache_path = Path(outputs["company_details_csv"]).parent / ".vader_cache.parquet"
+    cache = load_cache(cache_path) if news_cfg.get("sentiment_cache", True) else None
+    company_details = _analyze_items(company_items, outputs["company_details_csv"], preserve_non_empty, analyzer, cache)
+    ceo_details = _analyze_items(ceo_items, outputs["ceo_details_csv"], preserve_non_empty, analyzer, cache)
+    if cache is not None:
+        # Keep only this run's titles so the cache tracks one lookback window instead of growing forever.
+        used = {title_hash(item["title"]) for item in company_items + ceo_items}
+        save_cache(cache_path, {k: cache[k] for k in used if k in cache})
 
     company_summary = _summarize(company_details) if not company_details.empty else pd.DataFrame(
         columns=["symbol", "news_count", "positive_count", "neutral_count", "negative_count", "avg_sentiment", "top_links", "vibe"]
@@ -1,6 +1,13 @@
 import numpy as np
+import pandas as pd
 
 def apply_risk_overlay(proba, max_weight_per_stock=0.1):
-    w = (proba - 0.5).clip(-max_weight_per_stock, max_weight_per_stock)
-    gross = np.abs(w).sum()
-    return w / gross if gross > 0 else w
+    # One allocation for w; clip and normalise write into it in place.
+    w = np.subtract(np.asarray(proba, dtype=np.float64), 0.5)
+    np.clip(w, -max_weight_per_stock, max_weight_per_stock, out=w)
+    gross = np.nansum(np.abs(w))
+    if gross > 0:
+        np.divide(w, gross, out=w)
+    if isinstance(proba, pd.Series):
+        return pd.Series(w, index=proba.index, name=proba.name)
+    return w